@@ -1,13 +1,110 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, current_app
 from utils.file_manager import list_csv_files, read_file
 from utils.csv_parser import parse_csv, CSVParseError
+from utils.admission import AdmissionController, AdmissionRejected
+from functools import wraps
 import os
+import threading
+from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.utils import secure_filename
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'data'
 
+# Admission control: uploads and reads get separate concurrency pools so a
+# burst of large uploads cannot starve /api/load
+app.config['ADMISSION_ENABLED'] = True
+app.config['UPLOAD_CONCURRENCY'] = 2
+app.config['UPLOAD_RATE_LIMIT'] = 0.5   # uploads per second per client
+app.config['UPLOAD_RATE_BURST'] = 5
+app.config['READ_CONCURRENCY'] = 16
+app.config['READ_MAX_WAIT'] = 0.5       # seconds to wait for a free read slot
+app.config['READ_RATE_LIMIT'] = 20      # loads per second per client
+app.config['READ_RATE_BURST'] = 40
+
+# Number of reverse proxies in front of the app. Rate limits are keyed on the
+# client IP, so behind a proxy request.remote_addr must come from
+# X-Forwarded-For rather than the proxy's own address. Defaults to 0 (trust
+# no forwarding headers) so a directly exposed app can't be tricked into
+# per-request client IPs; the Procfile and render.yaml set it to 1. Read
+# once at startup.
+app.config['TRUSTED_PROXY_HOPS'] = int(os.environ.get('TRUSTED_PROXY_HOPS', '0'))
+if app.config['TRUSTED_PROXY_HOPS'] > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXY_HOPS'])
+
+
+def create_admission_controller(config):
+    """Build the admission controller from app configuration"""
+    controller = AdmissionController()
+    controller.add_pool(
+        'upload',
+        size=config['UPLOAD_CONCURRENCY'],
+        rate=config['UPLOAD_RATE_LIMIT'],
+        burst=config['UPLOAD_RATE_BURST'],
+    )
+    controller.add_pool(
+        'read',
+        size=config['READ_CONCURRENCY'],
+        rate=config['READ_RATE_LIMIT'],
+        burst=config['READ_RATE_BURST'],
+        max_wait=config['READ_MAX_WAIT'],
+    )
+    return controller
+
+
+ADMISSION_SETTINGS = (
+    'UPLOAD_CONCURRENCY', 'UPLOAD_RATE_LIMIT', 'UPLOAD_RATE_BURST',
+    'READ_CONCURRENCY', 'READ_MAX_WAIT', 'READ_RATE_LIMIT', 'READ_RATE_BURST',
+)
+_admission_lock = threading.Lock()
+
+
+def get_admission_controller():
+    """Return the current app's admission controller
+    
+    The controller is built on first use and rebuilt whenever one of the
+    ADMISSION_SETTINGS config values changes, so limits can be adjusted at
+    any time through app.config. Rebuilding resets all rate-limit buckets.
+    """
+    settings = tuple(current_app.config[key] for key in ADMISSION_SETTINGS)
+    with _admission_lock:
+        cached = current_app.extensions.get('admission')
+        if cached is None or cached[0] != settings:
+            cached = (settings, create_admission_controller(current_app.config))
+            current_app.extensions['admission'] = cached
+        return cached[1]
+
+
+def admission_controlled(pool_name):
+    """Decorator admitting requests into an admission pool before the view runs
+
+    Rejected requests get a JSON error with status 429 (client over its rate
+    limit) or 503 (pool saturated) and a Retry-After header. The request body
+    is not read for rejected requests.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not current_app.config['ADMISSION_ENABLED']:
+                return view(*args, **kwargs)
+            
+            try:
+                admission = get_admission_controller().admit(pool_name, request.remote_addr or 'unknown')
+            except AdmissionRejected as e:
+                response = jsonify({
+                    'error': 'Too many requests' if e.status_code == 429 else 'Server busy',
+                    'message': str(e)
+                })
+                response.status_code = e.status_code
+                response.headers['Retry-After'] = e.retry_after_header
+                return response
+            
+            with admission:
+                return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
 # Add CORS headers for development
 @app.after_request
 def add_cors_headers(response):
@@ -15,6 +112,7 @@ def add_cors_headers(response):
     response.headers['Access-Control-Allow-Origin'] = '*'
     response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
     response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    response.headers['Access-Control-Expose-Headers'] = 'Retry-After'
     return response
 
 
@@ -63,6 +161,7 @@ def get_files():
 
 
 @app.route('/api/load/<filename>')
+@admission_controlled('read')
 def load_file(filename):
     """Load and parse specified CSV file, return flashcards as JSON
     
@@ -75,7 +174,9 @@ def load_file(filename):
     Error responses:
         400: If filename is invalid or CSV is malformed
         404: If file is not found
+        429: If the client exceeds its read rate limit
         500: If file cannot be read or other server error
+        503: If all read slots are busy
     """
     try:
         # Read the file content
@@ -132,6 +233,7 @@ def load_file(filename):
 
 
 @app.route('/api/upload', methods=['POST'])
+@admission_controlled('upload')
 def upload_file():
     """Upload a CSV file to the data directory
     
@@ -140,7 +242,9 @@ def upload_file():
         
     Error responses:
         400: If no file provided, invalid file type, or CSV is malformed
+        429: If the client exceeds its upload rate limit
         500: If file cannot be saved or other server error
+        503: If all upload slots are busy
     """
     try:
         # Check if file is in request
@@ -0,0 +1,123 @@
+"""
+Upload storm benchmark for admission control.
+
+Hammers /api/upload with large CSVs from several simulated clients while a
+probe measures /api/load latency, once with admission control disabled and
+once with the shipped configuration, and reports the latency percentiles.
+
+Usage:
+    python -m benchmarks.upload_storm [--uploaders 8] [--duration 5] [--rows 20000]
+"""
+
+import argparse
+import io
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from app import app
+
+
+LOAD_URL = '/api/load/九上历史.csv'
+
+
+def make_csv(rows: int) -> str:
+    """Build CSV content with the given number of question/answer rows."""
+    return ''.join(f'"Question {i}, with comma","Answer {i}"\n' for i in range(rows))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, int(round(pct / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+def run_upload_storm(upload_threads: int, duration: float,
+                     payload: bytes) -> Tuple[List[float], Dict[int, int], Dict[int, int]]:
+    """
+    Hammer /api/upload from several clients while timing /api/load.
+    
+    Each uploader and each load request uses its own client address, so the
+    per-client rate limits apply as they would to separate users.
+    
+    Args:
+        upload_threads: Number of concurrent uploading clients
+        duration: Seconds to keep probing /api/load
+        payload: CSV file content to upload
+        
+    Returns:
+        Tuple of (load latencies in seconds, load status counts, upload status counts)
+    """
+    stop = threading.Event()
+    upload_statuses: Dict[int, int] = {}
+    statuses_lock = threading.Lock()
+
+    def uploader(client_ip):
+        with app.test_client() as upload_client:
+            while not stop.is_set():
+                response = upload_client.post('/api/upload', data={
+                    'file': (io.BytesIO(payload), 'storm.csv')
+                }, content_type='multipart/form-data', environ_base={'REMOTE_ADDR': client_ip})
+                with statuses_lock:
+                    upload_statuses[response.status_code] = upload_statuses.get(response.status_code, 0) + 1
+                if response.status_code in (429, 503):
+                    # Well-behaved client backing off (scaled down from Retry-After)
+                    time.sleep(0.05)
+
+    threads = [
+        threading.Thread(target=uploader, args=(f'203.0.113.{i}',))
+        for i in range(upload_threads)
+    ]
+    for thread in threads:
+        thread.start()
+
+    latencies: List[float] = []
+    load_statuses: Dict[int, int] = {}
+    try:
+        with app.test_client() as load_client:
+            deadline = time.perf_counter() + duration
+            while time.perf_counter() < deadline:
+                client_ip = f'198.51.100.{len(latencies) % 250}'
+                start = time.perf_counter()
+                response = load_client.get(LOAD_URL, environ_base={'REMOTE_ADDR': client_ip})
+                latencies.append(time.perf_counter() - start)
+                load_statuses[response.status_code] = load_statuses.get(response.status_code, 0) + 1
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return latencies, load_statuses, upload_statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--uploaders', type=int, default=8, help='concurrent uploading clients')
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per run')
+    parser.add_argument('--rows', type=int, default=20000, help='rows per uploaded CSV')
+    args = parser.parse_args()
+
+    payload = make_csv(args.rows).encode('utf-8')
+
+    with tempfile.TemporaryDirectory() as upload_folder:
+        app.config['UPLOAD_FOLDER'] = upload_folder
+
+        print(f"{args.uploaders} uploaders x {len(payload) / 1024:.0f} KB, {args.duration:.0f}s per run")
+        for enabled in (False, True):
+            app.config['ADMISSION_ENABLED'] = enabled
+            app.extensions.pop('admission', None)
+            latencies, load_statuses, upload_statuses = run_upload_storm(
+                args.uploaders, args.duration, payload
+            )
+            print(
+                f"admission {'on ' if enabled else 'off'}: "
+                f"/api/load p50 {percentile(latencies, 50) * 1000:6.1f} ms, "
+                f"p99 {percentile(latencies, 99) * 1000:6.1f} ms "
+                f"({len(latencies)} loads {load_statuses}, uploads {upload_statuses})"
+            )
+
+
+if __name__ == '__main__':
+    main()
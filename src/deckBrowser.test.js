@@ -0,0 +1,51 @@
+import { describe, it, expect } from 'vitest';
+import { readFileSync } from 'fs';
+
+// deckBrowser.js is a classic browser script (global class), so evaluate it
+// and pull the class out rather than importing it as a module
+const source = readFileSync(new URL('../static/js/deckBrowser.js', import.meta.url), 'utf8');
+const DeckBrowser = new Function(`${source}\nreturn DeckBrowser;`)();
+
+const layout = { rowHeight: 48, overscan: 8, poolSize: 26 };
+
+describe('DeckBrowser', () => {
+  describe('getVisibleRange', () => {
+    it('should start at the first row when scrolled to the top', () => {
+      const range = DeckBrowser.getVisibleRange({ ...layout, scrollTop: 0, total: 100000 });
+
+      expect(range).toEqual({ first: 0, last: 26 });
+    });
+
+    it('should include overscan rows above the viewport', () => {
+      // Row 1000 is at the top of the viewport
+      const range = DeckBrowser.getVisibleRange({ ...layout, scrollTop: 1000 * 48, total: 100000 });
+
+      expect(range).toEqual({ first: 992, last: 1018 });
+    });
+
+    it('should treat a partly scrolled row as still visible', () => {
+      const range = DeckBrowser.getVisibleRange({ ...layout, scrollTop: 1000 * 48 + 47, total: 100000 });
+
+      expect(range.first).toBe(992);
+    });
+
+    it('should stop at the last card', () => {
+      const range = DeckBrowser.getVisibleRange({ ...layout, scrollTop: 99990 * 48, total: 100000 });
+
+      expect(range).toEqual({ first: 99982, last: 100000 });
+    });
+
+    it('should cover only the cards that exist in a deck smaller than the pool', () => {
+      const range = DeckBrowser.getVisibleRange({ ...layout, scrollTop: 0, total: 5 });
+
+      expect(range).toEqual({ first: 0, last: 5 });
+    });
+
+    it('should never cover more rows than the pool holds', () => {
+      for (const scrollTop of [0, 123, 4800, 48000, 4799952]) {
+        const { first, last } = DeckBrowser.getVisibleRange({ ...layout, scrollTop, total: 100000 });
+        expect(last - first).toBeLessThanOrEqual(layout.poolSize);
+      }
+    });
+  });
+});
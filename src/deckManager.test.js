@@ -0,0 +1,101 @@
+import { describe, it, expect } from 'vitest';
+import { readFileSync } from 'fs';
+
+// deckManager.js is a classic browser script (global class), so evaluate it
+// and pull the class out rather than importing it as a module
+const source = readFileSync(new URL('../static/js/deckManager.js', import.meta.url), 'utf8');
+const DeckManager = new Function(`${source}\nreturn DeckManager;`)();
+
+function makeCards(count) {
+  return Array.from({ length: count }, (_, i) => ({
+    id: i + 1,
+    question: `问题${i + 1}`,
+    answer: `答案${i + 1}`
+  }));
+}
+
+describe('DeckManager', () => {
+  describe('indexOfCardId', () => {
+    it('should map card ids to their position after loadDeck', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(5));
+
+      expect(deck.indexOfCardId(1)).toBe(0);
+      expect(deck.indexOfCardId(5)).toBe(4);
+    });
+
+    it('should return -1 for unknown, NaN or missing ids', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(3));
+
+      expect(deck.indexOfCardId(0)).toBe(-1);
+      expect(deck.indexOfCardId(4)).toBe(-1);
+      expect(deck.indexOfCardId(NaN)).toBe(-1);
+      expect(deck.indexOfCardId(undefined)).toBe(-1);
+      expect(deck.indexOfCardId('1')).toBe(-1);
+    });
+
+    it('should follow cards to their new positions after shuffle', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(50));
+      deck.shuffle();
+
+      deck.cards.forEach((card, index) => {
+        expect(deck.indexOfCardId(card.id)).toBe(index);
+      });
+    });
+
+    it('should replace the previous deck on loadDeck', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(10));
+      deck.loadDeck(makeCards(2));
+
+      expect(deck.indexOfCardId(2)).toBe(1);
+      expect(deck.indexOfCardId(10)).toBe(-1);
+    });
+  });
+
+  describe('jumpTo', () => {
+    it('should set currentIndex for a valid index', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(5));
+
+      expect(deck.jumpTo(3)).toBe(true);
+      expect(deck.currentIndex).toBe(3);
+      expect(deck.getCurrentCard().id).toBe(4);
+      expect(deck.getProgress()).toEqual({ current: 4, total: 5 });
+    });
+
+    it('should reject out-of-range and non-integer indexes without moving', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(5));
+      deck.jumpTo(2);
+
+      for (const index of [-1, 5, 1.5, NaN, undefined, '3']) {
+        expect(deck.jumpTo(index)).toBe(false);
+        expect(deck.currentIndex).toBe(2);
+      }
+    });
+
+    it('should reject any index on an empty deck', () => {
+      const deck = new DeckManager();
+      deck.loadDeck([]);
+
+      expect(deck.jumpTo(0)).toBe(false);
+      expect(deck.currentIndex).toBe(0);
+    });
+
+    it('should jump to a card by id after shuffle', () => {
+      const deck = new DeckManager();
+      deck.loadDeck(makeCards(20));
+      deck.shuffle();
+
+      expect(deck.jumpTo(deck.indexOfCardId(7))).toBe(true);
+      expect(deck.getCurrentCard().id).toBe(7);
+
+      // Unknown ids map to -1, which jumpTo rejects
+      expect(deck.jumpTo(deck.indexOfCardId(21))).toBe(false);
+      expect(deck.getCurrentCard().id).toBe(7);
+    });
+  });
+});
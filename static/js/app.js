@@ -7,12 +7,14 @@ class AppController {
     // Component instances
     this.deckManager = null;
     this.cardView = null;
+    this.deckBrowser = null;
     
     // Application state
     this.state = {
       currentFile: null,
       availableFiles: [],
-      isLoading: false
+      isLoading: false,
+      isBrowsing: false
     };
     
     // DOM elements
@@ -26,7 +28,13 @@ class AppController {
       restartBtn: null,
       errorMessage: null,
       fileUpload: null,
-      uploadBtn: null
+      uploadBtn: null,
+      cardSection: null,
+      browseSection: null,
+      browseViewport: null,
+      browseBtn: null,
+      jumpInput: null,
+      jumpBtn: null
     };
   }
   
@@ -46,10 +54,19 @@ class AppController {
     this.elements.errorMessage = document.getElementById('error-message');
     this.elements.fileUpload = document.getElementById('file-upload');
     this.elements.uploadBtn = document.getElementById('upload-btn');
+    this.elements.cardSection = document.querySelector('.card-section');
+    this.elements.browseSection = document.getElementById('browse-section');
+    this.elements.browseViewport = document.getElementById('browse-viewport');
+    this.elements.browseBtn = document.getElementById('browse-btn');
+    this.elements.jumpInput = document.getElementById('jump-input');
+    this.elements.jumpBtn = document.getElementById('jump-btn');
     
     // Initialize components
     this.deckManager = new DeckManager();
     this.cardView = new CardView(this.elements.cardContainer);
+    this.deckBrowser = new DeckBrowser(this.elements.browseViewport, {
+      onSelect: (card) => this.handleBrowseSelect(card)
+    });
     
     // Set up event listeners
     this.setupEventListeners();
@@ -80,6 +97,16 @@ class AppController {
     // Upload button
     this.elements.uploadBtn.addEventListener('click', () => this.handleUploadClick());
     
+    // Deck browser
+    this.elements.browseBtn.addEventListener('click', () => this.handleBrowseClick());
+    this.elements.jumpBtn.addEventListener('click', () => this.handleJumpClick());
+    this.elements.jumpInput.addEventListener('keydown', (e) => {
+      if (e.key === 'Enter') {
+        e.preventDefault();
+        this.handleJumpClick();
+      }
+    });
+    
     // Keyboard events
     document.addEventListener('keydown', (e) => this.handleKeyPress(e));
   }
@@ -159,6 +186,10 @@ class AppController {
       // Update state
       this.state.currentFile = filename;
       
+      // Browser lists the deck in file order, whatever the study order
+      this.deckBrowser.load(this.deckManager.originalOrder);
+      this.elements.jumpInput.max = this.deckManager.originalOrder.length;
+      
       // Render first card with question side
       const firstCard = this.deckManager.getCurrentCard();
       this.cardView.render(firstCard, true);
@@ -282,6 +313,81 @@ class AppController {
     this.updateProgress();
   }
   
+  /**
+   * Handle browse button click - toggle between study and browse views
+   */
+  handleBrowseClick() {
+    if (this.deckManager.cards.length === 0) {
+      return;
+    }
+    
+    this.setBrowsing(!this.state.isBrowsing);
+  }
+  
+  /**
+   * Show or hide the deck browser
+   * @param {boolean} isBrowsing - Whether the browse view should be shown
+   */
+  setBrowsing(isBrowsing) {
+    this.state.isBrowsing = isBrowsing;
+    this.elements.browseSection.hidden = !isBrowsing;
+    this.elements.cardSection.hidden = isBrowsing;
+    this.elements.browseBtn.setAttribute('aria-pressed', isBrowsing.toString());
+    
+    if (isBrowsing) {
+      // Start with the current card in view
+      const currentCard = this.deckManager.getCurrentCard();
+      if (currentCard) {
+        this.deckBrowser.scrollToRow(currentCard.id - 1);
+      }
+    }
+  }
+  
+  /**
+   * Handle a click on a row in the deck browser
+   * @param {Object} card - Flashcard object for the clicked row
+   */
+  handleBrowseSelect(card) {
+    if (this.jumpToCard(card.id)) {
+      this.setBrowsing(false);
+    }
+  }
+  
+  /**
+   * Handle jump button click (or Enter in the jump input)
+   */
+  handleJumpClick() {
+    const id = parseInt(this.elements.jumpInput.value, 10);
+    
+    if (!this.jumpToCard(id)) {
+      this.showError(`Card #${this.elements.jumpInput.value} does not exist in this deck`);
+      return;
+    }
+    
+    if (this.state.isBrowsing) {
+      this.deckBrowser.scrollToRow(id - 1);
+    }
+  }
+  
+  /**
+   * Make the card with the given id the current card
+   * @param {number} id - Flashcard id (its 1-based position in the deck file order)
+   * @returns {boolean} True if the card exists in the deck
+   */
+  jumpToCard(id) {
+    if (!this.deckManager.jumpTo(this.deckManager.indexOfCardId(id))) {
+      return false;
+    }
+    
+    // Render the card with question side (reset flip state)
+    const currentCard = this.deckManager.getCurrentCard();
+    this.cardView.render(currentCard, true);
+    
+    // Update progress indicator
+    this.updateProgress();
+    return true;
+  }
+  
   /**
    * Handle upload button click
    */
@@ -357,6 +463,15 @@ class AppController {
       return;
     }
     
+    // In browse mode, leave keys to the scrollable list except B/Escape
+    if (this.state.isBrowsing) {
+      if (event.key === 'Escape' || event.key === 'b' || event.key === 'B') {
+        event.preventDefault();
+        this.setBrowsing(false);
+      }
+      return;
+    }
+    
     // Map keyboard shortcuts to actions
     switch (event.key) {
       case ' ':  // Spacebar
@@ -386,6 +501,12 @@ class AppController {
         event.preventDefault();
         this.handleRestartClick();
         break;
+        
+      case 'b':
+      case 'B':
+        event.preventDefault();
+        this.handleBrowseClick();
+        break;
     }
   }
   
@@ -395,6 +516,10 @@ class AppController {
   updateProgress() {
     const progress = this.deckManager.getProgress();
     this.elements.progressText.textContent = `${progress.current} of ${progress.total}`;
+    
+    // Keep the browser's highlighted row in sync with the current card
+    const currentCard = this.deckManager.getCurrentCard();
+    this.deckBrowser.setActiveId(currentCard ? currentCard.id : null);
   }
   
   /**
@@ -0,0 +1,227 @@
+/**
+ * DeckBrowser - Virtualized list view for browsing large decks
+ * Renders only the rows inside the visible window using a fixed pool of
+ * DOM nodes, so the DOM size stays constant however large the deck is
+ */
+class DeckBrowser {
+  /**
+   * @param {HTMLElement} viewportElement - Scrollable element containing a .browse-canvas
+   * @param {Object} options - Optional settings
+   * @param {number} options.rowHeight - Row height in pixels (must match CSS)
+   * @param {number} options.overscan - Extra rows rendered above and below the viewport
+   * @param {Function} options.onSelect - Called with the card object when a row is clicked
+   */
+  constructor(viewportElement, options = {}) {
+    // DOM elements
+    this.viewport = viewportElement;
+    this.canvas = viewportElement.querySelector('.browse-canvas');
+    this.rows = [];
+
+    // Settings
+    this.rowHeight = options.rowHeight || 48;
+    this.overscan = options.overscan || 8;
+    this.onSelect = options.onSelect || (() => {});
+
+    // Deck state: cards in CSV file order
+    this.cards = [];
+    this.activeId = null;
+
+    this.renderScheduled = false;
+
+    this.viewport.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+    this.canvas.addEventListener('click', (e) => this.handleRowClick(e));
+    window.addEventListener('resize', () => this.scheduleRender());
+  }
+
+  /**
+   * Reset the browser for a new deck
+   * @param {Array} cards - Flashcard objects in CSV file order
+   */
+  load(cards) {
+    this.cards = cards || [];
+
+    this.canvas.style.height = `${this.cards.length * this.rowHeight}px`;
+    this.viewport.scrollTop = 0;
+
+    // Force every pooled row to refresh its content, and drop text left
+    // over from the previous deck
+    this.rows.forEach(row => {
+      row.rowIndex = -1;
+      row.hidden = true;
+      row.idCell.textContent = '';
+      row.questionCell.textContent = '';
+      row.answerCell.textContent = '';
+    });
+
+    this.scheduleRender();
+  }
+
+  /**
+   * Highlight the row for the given card
+   * @param {number|null} id - Flashcard id, or null for no highlight
+   */
+  setActiveId(id) {
+    this.activeId = id;
+    this.scheduleRender();
+  }
+
+  /**
+   * Scroll so the given row is centred in the viewport
+   * @param {number} index - Row index (0-based position in the deck file order)
+   */
+  scrollToRow(index) {
+    const offset = index * this.rowHeight - (this.viewport.clientHeight - this.rowHeight) / 2;
+    this.viewport.scrollTop = Math.max(0, offset);
+    this.scheduleRender();
+  }
+
+  /**
+   * Render on the next animation frame, coalescing multiple scroll events
+   */
+  scheduleRender() {
+    if (this.renderScheduled) {
+      return;
+    }
+    this.renderScheduled = true;
+    requestAnimationFrame(() => this.render());
+  }
+
+  /**
+   * Position the row pool over the visible window and fill in card content
+   */
+  render() {
+    this.renderScheduled = false;
+
+    // Nothing to measure while the browse section is hidden
+    const viewportHeight = this.viewport.clientHeight;
+    if (viewportHeight === 0) {
+      return;
+    }
+
+    this.ensureRowPool(Math.ceil(viewportHeight / this.rowHeight) + this.overscan * 2);
+
+    const { first, last } = DeckBrowser.getVisibleRange({
+      scrollTop: this.viewport.scrollTop,
+      rowHeight: this.rowHeight,
+      overscan: this.overscan,
+      poolSize: this.rows.length,
+      total: this.cards.length
+    });
+
+    // Each row index always maps to the same pooled node, so scrolling by one
+    // row only rewrites the node that moved from one edge to the other
+    for (let rowIndex = first; rowIndex < first + this.rows.length; rowIndex++) {
+      const row = this.rows[rowIndex % this.rows.length];
+      if (rowIndex < last) {
+        this.updateRow(row, rowIndex);
+      } else {
+        row.hidden = true;
+        row.rowIndex = -1;
+      }
+    }
+  }
+
+  /**
+   * Compute the range of rows the pool should cover for a scroll position
+   * @param {Object} params - Scroll position and layout
+   * @param {number} params.scrollTop - Viewport scroll offset in pixels
+   * @param {number} params.rowHeight - Row height in pixels
+   * @param {number} params.overscan - Extra rows rendered above the viewport
+   * @param {number} params.poolSize - Number of pooled row elements
+   * @param {number} params.total - Number of cards in the deck
+   * @returns {{first: number, last: number}} First row index, and one past the last row index
+   */
+  static getVisibleRange({ scrollTop, rowHeight, overscan, poolSize, total }) {
+    const first = Math.max(0, Math.floor(scrollTop / rowHeight) - overscan);
+    const last = Math.min(total, first + poolSize);
+    return { first, last };
+  }
+
+  /**
+   * Grow or shrink the pool of row elements to the given size
+   * @param {number} size - Number of row elements needed to cover the viewport
+   */
+  ensureRowPool(size) {
+    if (this.rows.length === size) {
+      return;
+    }
+
+    while (this.rows.length < size) {
+      const row = document.createElement('div');
+      row.className = 'browse-row';
+      row.setAttribute('role', 'row');
+      row.style.height = `${this.rowHeight}px`;
+
+      row.idCell = this.createCell(row, 'browse-cell browse-cell-id');
+      row.questionCell = this.createCell(row, 'browse-cell');
+      row.answerCell = this.createCell(row, 'browse-cell');
+      row.rowIndex = -1;
+
+      this.canvas.appendChild(row);
+      this.rows.push(row);
+    }
+
+    while (this.rows.length > size) {
+      this.rows.pop().remove();
+    }
+
+    // Row → node mapping depends on pool size, so refresh everything
+    this.rows.forEach(row => {
+      row.rowIndex = -1;
+    });
+  }
+
+  /**
+   * Create a cell element inside a row
+   * @param {HTMLElement} row - Parent row element
+   * @param {string} className - CSS classes for the cell
+   * @returns {HTMLElement} The new cell
+   */
+  createCell(row, className) {
+    const cell = document.createElement('span');
+    cell.className = className;
+    cell.setAttribute('role', 'cell');
+    row.appendChild(cell);
+    return cell;
+  }
+
+  /**
+   * Update a pooled row to show the given row index
+   * Only touches the DOM when the row moved to a new index
+   * @param {HTMLElement} row - Pooled row element
+   * @param {number} rowIndex - Row index to display
+   */
+  updateRow(row, rowIndex) {
+    const card = this.cards[rowIndex];
+
+    if (row.rowIndex !== rowIndex) {
+      row.rowIndex = rowIndex;
+      row.hidden = false;
+      row.style.transform = `translateY(${rowIndex * this.rowHeight}px)`;
+
+      row.idCell.textContent = `#${card.id}`;
+      row.questionCell.textContent = card.question;
+      row.answerCell.textContent = card.answer;
+    }
+
+    row.classList.toggle('active', card.id === this.activeId);
+  }
+
+  /**
+   * Handle a click on a row
+   * @param {MouseEvent} event - Click event
+   */
+  handleRowClick(event) {
+    const row = event.target.closest('.browse-row');
+    if (!row || row.rowIndex < 0) {
+      return;
+    }
+
+    this.onSelect(this.cards[row.rowIndex]);
+  }
+}
+
+// Export for use in other modules (if using modules) or make available globally
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = DeckBrowser;
+}
@@ -7,6 +7,8 @@ class DeckManager {
     this.cards = [];
     this.currentIndex = 0;
     this.originalOrder = [];
+    // Map of card id → index in this.cards, for jump-to-card
+    this.indexById = new Map();
   }
 
   /**
@@ -18,6 +20,37 @@ class DeckManager {
     this.currentIndex = 0;
     // Store original order for restart functionality
     this.originalOrder = [...this.cards];
+    this.rebuildIndex();
+  }
+
+  /**
+   * Rebuild the card id → index lookup after the card order changes
+   */
+  rebuildIndex() {
+    this.indexById = new Map(this.cards.map((card, index) => [card.id, index]));
+  }
+
+  /**
+   * Get the position of a card in the current deck order
+   * @param {number} id - Flashcard id
+   * @returns {number} Index in the deck, or -1 if not found
+   */
+  indexOfCardId(id) {
+    const index = this.indexById.get(id);
+    return index === undefined ? -1 : index;
+  }
+
+  /**
+   * Jump to the card at the given index
+   * @param {number} index - Index in the current deck order
+   * @returns {boolean} True if the index was valid and the current card changed
+   */
+  jumpTo(index) {
+    if (!Number.isInteger(index) || index < 0 || index >= this.cards.length) {
+      return false;
+    }
+    this.currentIndex = index;
+    return true;
   }
 
   /**
@@ -83,6 +116,7 @@ class DeckManager {
 
     this.cards = shuffled;
     this.currentIndex = 0;
+    this.rebuildIndex();
   }
 
   /**
@@ -0,0 +1,284 @@
+"""Tests for admission control and per-client rate limiting."""
+
+import io
+import json
+import time
+
+import pytest
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from app import app, get_admission_controller, ADMISSION_SETTINGS
+from benchmarks.upload_storm import make_csv, run_upload_storm
+from utils.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    ClientRateLimiter,
+    ConcurrencyPool,
+    TokenBucket,
+)
+
+
+LOAD_URL = '/api/load/九上历史.csv'
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic rate limiter tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app."""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def fresh_admission(monkeypatch):
+    """Give each test its own admission controller and config, so buckets aren't shared."""
+    for key in ('ADMISSION_ENABLED',) + ADMISSION_SETTINGS:
+        monkeypatch.setitem(app.config, key, app.config[key])
+    app.extensions.pop('admission', None)
+    yield
+    app.extensions.pop('admission', None)
+
+
+@pytest.fixture
+def controller():
+    """Apply admission config overrides and return the controller built from them."""
+    def install(**overrides):
+        app.config.update(overrides)
+        with app.app_context():
+            return get_admission_controller()
+    return install
+
+
+def test_token_bucket_consumes_and_refills():
+    """Test that a bucket allows bursts and reports time until next token."""
+    bucket = TokenBucket(rate=2.0, capacity=2.0, now=0.0)
+    assert bucket.try_consume(0.0) == 0.0
+    assert bucket.try_consume(0.0) == 0.0
+    assert bucket.try_consume(0.0) == pytest.approx(0.5)
+
+    # Half a second refills one token at 2 tokens/s
+    assert bucket.try_consume(0.5) == 0.0
+    assert bucket.try_consume(0.5) == pytest.approx(0.5)
+
+
+def test_rate_limiter_is_per_client():
+    """Test that one client hitting its limit does not affect another."""
+    clock = FakeClock()
+    limiter = ClientRateLimiter(rate=1.0, burst=1, clock=clock)
+
+    assert limiter.check('10.0.0.1') == 0.0
+    assert limiter.check('10.0.0.1') == pytest.approx(1.0)
+    assert limiter.check('10.0.0.2') == 0.0
+
+    clock.now = 1.0
+    assert limiter.check('10.0.0.1') == 0.0
+
+
+def test_rate_limiter_evicts_least_recently_seen_client():
+    """Test that the number of buckets never exceeds max_clients."""
+    clock = FakeClock()
+    limiter = ClientRateLimiter(rate=1.0, burst=1, max_clients=3, clock=clock)
+
+    for i in range(3):
+        limiter.check(f'10.0.0.{i}')
+    # Touch client 0 so client 1 is now the least recently seen
+    limiter.check('10.0.0.0')
+
+    for i in range(100, 200):
+        limiter.check(f'10.0.1.{i}')
+        assert len(limiter) <= 3
+
+    limiter = ClientRateLimiter(rate=1.0, burst=1, max_clients=3, clock=clock)
+    for i in range(3):
+        limiter.check(f'10.0.0.{i}')
+    limiter.check('10.0.0.0')
+    limiter.check('10.0.0.99')
+
+    # Client 0 kept its (empty) bucket; client 1 was evicted and starts fresh
+    assert limiter.check('10.0.0.0') > 0
+    assert limiter.check('10.0.0.2') > 0
+    assert len(limiter) == 3
+
+
+def test_rate_limiter_rejects_invalid_settings():
+    """Test that non-positive rates are rejected."""
+    with pytest.raises(ValueError):
+        ClientRateLimiter(rate=0, burst=1)
+
+
+def test_concurrency_pool_fails_fast_when_saturated():
+    """Test that a full pool with no wait rejects immediately."""
+    pool = ConcurrencyPool(size=1)
+    assert pool.try_acquire()
+    assert not pool.try_acquire()
+    pool.release()
+    assert pool.try_acquire()
+
+
+def test_admission_controller_rejections():
+    """Test 503 for a saturated pool and 429 for a rate-limited client."""
+    controller = AdmissionController(saturated_retry_after=2.0)
+    controller.add_pool('upload', size=1)
+    controller.add_pool('read', size=4, rate=1.0, burst=1)
+
+    with controller.admit('upload', 'a'):
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.admit('upload', 'b')
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.retry_after_header == '2'
+
+        # A saturated upload pool does not block reads
+        with controller.admit('read', 'a'):
+            pass
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        controller.admit('read', 'a')
+    assert excinfo.value.status_code == 429
+
+    # The slot was released when the context exited
+    with controller.admit('upload', 'b'):
+        pass
+
+
+def test_saturated_rejection_keeps_rate_budget():
+    """Test that requests rejected with 503 don't consume the client's tokens."""
+    controller = AdmissionController()
+    controller.add_pool('upload', size=1, rate=0.5, burst=3)
+
+    with controller.admit('upload', 'a'):
+        for _ in range(3):
+            with pytest.raises(AdmissionRejected) as excinfo:
+                controller.admit('upload', 'b')
+            assert excinfo.value.status_code == 503
+
+    # Client b still has its full burst once the pool frees up
+    for _ in range(3):
+        with controller.admit('upload', 'b'):
+            pass
+
+
+def test_over_limit_client_rejected_without_waiting_for_slot():
+    """Test that an over-limit client gets 429 immediately even while the pool is full."""
+    controller = AdmissionController()
+    controller.add_pool('read', size=1, rate=1.0, burst=1, max_wait=5.0)
+
+    with controller.admit('read', 'a'):
+        start = time.perf_counter()
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.admit('read', 'a')
+        assert excinfo.value.status_code == 429
+        assert time.perf_counter() - start < 1.0
+
+
+def test_rate_limiter_refund():
+    """Test that a refunded token can be used again, but not beyond the burst."""
+    clock = FakeClock()
+    limiter = ClientRateLimiter(rate=1.0, burst=1, clock=clock)
+
+    assert limiter.check('a') == 0.0
+    limiter.refund('a')
+    assert limiter.check('a') == 0.0
+    assert limiter.check('a') > 0
+
+    limiter.refund('a')
+    limiter.refund('a')
+    assert limiter.check('a') == 0.0
+    assert limiter.check('a') > 0
+
+
+def test_load_rate_limited_returns_429(client, controller):
+    """Test GET /api/load returns 429 with Retry-After once the client's bucket is empty."""
+    controller(READ_RATE_LIMIT=1, READ_RATE_BURST=2)
+
+    assert client.get(LOAD_URL).status_code == 200
+    assert client.get(LOAD_URL).status_code == 200
+
+    response = client.get(LOAD_URL)
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
+    data = json.loads(response.data)
+    assert data['error'] == 'Too many requests'
+
+
+def test_upload_saturated_returns_503(client, controller):
+    """Test POST /api/upload returns 503 with Retry-After when all upload slots are busy."""
+    admission = controller(UPLOAD_CONCURRENCY=1)
+
+    with admission.admit('upload', 'other-client'):
+        response = client.post('/api/upload', data={
+            'file': (io.BytesIO(b'q,a\n'), 'cards.csv')
+        }, content_type='multipart/form-data')
+
+    assert response.status_code == 503
+    assert 'Retry-After' in response.headers
+    data = json.loads(response.data)
+    assert data['error'] == 'Server busy'
+
+
+def test_admission_config_changes_apply_at_runtime(client):
+    """Test that changing limits in app.config takes effect without a restart."""
+    assert client.get(LOAD_URL).status_code == 200
+
+    app.config.update(READ_RATE_LIMIT=1, READ_RATE_BURST=1)
+    assert client.get(LOAD_URL).status_code == 200
+    assert client.get(LOAD_URL).status_code == 429
+
+
+def test_forwarded_for_ignored_by_default(client, controller):
+    """Test that X-Forwarded-For can't pick the client IP when no proxy is trusted."""
+    controller(READ_RATE_LIMIT=1, READ_RATE_BURST=1)
+
+    assert client.get(LOAD_URL, headers={'X-Forwarded-For': '203.0.113.1'}).status_code == 200
+    assert client.get(LOAD_URL, headers={'X-Forwarded-For': '203.0.113.2'}).status_code == 429
+
+
+def test_rate_limit_keyed_on_forwarded_client(client, controller, monkeypatch):
+    """Test that clients behind one trusted proxy get separate rate-limit buckets."""
+    monkeypatch.setattr(app, 'wsgi_app', ProxyFix(app.wsgi_app, x_for=1))
+    controller(READ_RATE_LIMIT=1, READ_RATE_BURST=1)
+    proxy = {'REMOTE_ADDR': '10.0.0.1'}
+
+    for i in range(5):
+        response = client.get(LOAD_URL, environ_base=proxy,
+                              headers={'X-Forwarded-For': f'203.0.113.{i}'})
+        assert response.status_code == 200
+
+    # Only the hop added by the trusted proxy counts, so a client can't
+    # dodge its limit by prepending a fake address
+    response = client.get(LOAD_URL, environ_base=proxy,
+                          headers={'X-Forwarded-For': '198.51.100.7, 203.0.113.0'})
+    assert response.status_code == 429
+
+
+def test_admission_can_be_disabled(client, controller, monkeypatch):
+    """Test that ADMISSION_ENABLED=False bypasses rate limiting."""
+    controller(READ_RATE_LIMIT=1, READ_RATE_BURST=1)
+    monkeypatch.setitem(app.config, 'ADMISSION_ENABLED', False)
+
+    for _ in range(3):
+        assert client.get(LOAD_URL).status_code == 200
+
+
+def test_upload_storm_sheds_uploads(monkeypatch, tmp_path):
+    """Test that concurrent uploads beyond the upload pool get 503 while loads still succeed.
+
+    Latency numbers live in the benchmarks.upload_storm script.
+    """
+    app.config['TESTING'] = True
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    payload = make_csv(5000).encode('utf-8')
+
+    _, load_statuses, upload_statuses = run_upload_storm(8, 0.5, payload)
+
+    assert upload_statuses.get(503, 0) > 0
+    assert set(load_statuses) == {200}
@@ -1,7 +1,9 @@
 """Unit tests for Flask API routes."""
 
 import pytest
+import io
 import json
+import os
 from app import app
 
 
@@ -9,6 +11,8 @@ from app import app
 def client():
     """Create a test client for the Flask app."""
     app.config['TESTING'] = True
+    # Start each test with fresh rate-limit buckets
+    app.extensions.pop('admission', None)
     with app.test_client() as client:
         yield client
 
@@ -92,3 +96,27 @@ def test_cors_headers(client):
     response = client.get('/api/files')
     assert 'Access-Control-Allow-Origin' in response.headers
     assert response.headers['Access-Control-Allow-Origin'] == '*'
+
+
+def test_load_file_after_overwrite(client):
+    """Test that re-uploading a deck with the same name serves the new cards."""
+    filename = 'test_overwrite_deck.csv'
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    
+    def upload(content):
+        response = client.post('/api/upload', data={
+            'file': (io.BytesIO(content), filename)
+        }, content_type='multipart/form-data')
+        assert response.status_code == 200
+    
+    try:
+        upload(b'Old question,Old answer\n')
+        data = json.loads(client.get(f'/api/load/{filename}').data)
+        assert [card['question'] for card in data['cards']] == ['Old question']
+        
+        upload(b'New question,New answer\nSecond question,Second answer\n')
+        data = json.loads(client.get(f'/api/load/{filename}').data)
+        assert [card['question'] for card in data['cards']] == ['New question', 'Second question']
+    finally:
+        if os.path.exists(filepath):
+            os.remove(filepath)
@@ -0,0 +1,234 @@
+"""
+Admission control module for protecting API endpoints under load.
+
+This module provides per-client token-bucket rate limiting and bounded
+concurrency pools, so that a burst of expensive requests (such as large
+CSV uploads) cannot starve cheaper ones (such as deck loads) running in
+the same process.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+
+class AdmissionRejected(Exception):
+    """Exception raised when a request is not admitted.
+
+    Attributes:
+        status_code: HTTP status to respond with (429 or 503)
+        retry_after: Seconds the client should wait before retrying
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: float):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After value as whole seconds (at least 1), per RFC 9110."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucket:
+    """Token bucket holding up to `capacity` tokens, refilled at `rate` per second.
+
+    Not thread-safe on its own; callers must hold a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def try_consume(self, now: float, amount: float = 1.0) -> float:
+        """Take `amount` tokens if available.
+
+        Args:
+            now: Current monotonic time in seconds
+            amount: Number of tokens to consume
+
+        Returns:
+            0.0 if the tokens were consumed, otherwise the number of seconds
+            until enough tokens will be available
+        """
+        self._refill(now)
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def refund(self, now: float, amount: float = 1.0) -> None:
+        """Give back `amount` tokens, up to the bucket's capacity."""
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class ClientRateLimiter:
+    """In-memory token-bucket rate limiter keyed by client identifier.
+
+    At most `max_clients` buckets are kept; when a new client arrives at the
+    cap, the least recently seen client's bucket is evicted, so memory stays
+    bounded however many distinct IPs show up.
+    """
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._clock = clock
+        self._buckets: 'OrderedDict[str, TokenBucket]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, client_id: str) -> float:
+        """Consume one token for `client_id`.
+
+        Returns:
+            0.0 if the request is allowed, otherwise seconds until it would be
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(client_id)
+            if bucket is None:
+                while len(self._buckets) >= self.max_clients:
+                    self._buckets.popitem(last=False)
+                bucket = TokenBucket(self.rate, self.burst, now)
+                self._buckets[client_id] = bucket
+            else:
+                self._buckets.move_to_end(client_id)
+            return bucket.try_consume(now)
+
+    def refund(self, client_id: str) -> None:
+        """Return a token taken by `check` for a request that was not served."""
+        with self._lock:
+            bucket = self._buckets.get(client_id)
+            if bucket is not None:
+                bucket.refund(self._clock())
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class ConcurrencyPool:
+    """Bounded pool of in-flight request slots.
+
+    Requests wait at most `max_wait` seconds for a free slot; a `max_wait`
+    of 0 rejects immediately when the pool is saturated.
+    """
+
+    def __init__(self, size: int, max_wait: float = 0.0):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.max_wait = max_wait
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    def try_acquire(self) -> bool:
+        """Acquire a slot, waiting up to `max_wait` seconds."""
+        if self.max_wait > 0:
+            return self._semaphore.acquire(timeout=self.max_wait)
+        return self._semaphore.acquire(blocking=False)
+
+    def release(self) -> None:
+        """Return a slot to the pool."""
+        self._semaphore.release()
+
+
+class AdmissionController:
+    """Admission controller combining rate limits and concurrency pools.
+
+    Each named pool (e.g. "upload", "read") has its own concurrency limit
+    and its own per-client rate limiter, so saturation of one pool never
+    blocks requests admitted to another.
+
+    Example:
+        >>> controller = AdmissionController()
+        >>> controller.add_pool('read', size=8, rate=20, burst=40)
+        >>> with controller.admit('read', '127.0.0.1'):
+        ...     pass
+    """
+
+    def __init__(self, saturated_retry_after: float = 1.0):
+        self.saturated_retry_after = saturated_retry_after
+        self._pools: Dict[str, Tuple[ConcurrencyPool, Optional[ClientRateLimiter]]] = {}
+
+    def add_pool(self, name: str, size: int, rate: Optional[float] = None,
+                 burst: Optional[float] = None, max_wait: float = 0.0) -> None:
+        """Register a named pool.
+
+        Args:
+            name: Pool name used by `admit`
+            size: Maximum number of concurrent requests in the pool
+            rate: Requests per second allowed per client (None disables rate limiting)
+            burst: Bucket capacity per client (defaults to `rate`)
+            max_wait: Seconds to wait for a free slot before rejecting with 503
+        """
+        limiter = None
+        if rate is not None:
+            limiter = ClientRateLimiter(rate, burst if burst is not None else max(1.0, rate))
+        self._pools[name] = (ConcurrencyPool(size, max_wait), limiter)
+
+    def admit(self, pool_name: str, client_id: str) -> '_Admission':
+        """Admit a request into `pool_name` or raise AdmissionRejected.
+
+        Args:
+            pool_name: Name of a pool registered with `add_pool`
+            client_id: Identifier of the client (typically its IP address)
+
+        Returns:
+            Context manager that releases the pool slot on exit
+
+        Raises:
+            KeyError: If the pool has not been registered
+            AdmissionRejected: 429 if the client is over its rate limit,
+                503 if the pool has no free slot
+        """
+        pool, limiter = self._pools[pool_name]
+
+        # Check the rate limit first so over-limit clients get a fast 429
+        # without waiting for (or competing for) a pool slot
+        if limiter is not None:
+            wait = limiter.check(client_id)
+            if wait > 0:
+                raise AdmissionRejected(
+                    f"Too many {pool_name} requests. Please slow down.",
+                    status_code=429,
+                    retry_after=wait,
+                )
+
+        if not pool.try_acquire():
+            # Requests shed with 503 shouldn't use up the client's rate budget
+            if limiter is not None:
+                limiter.refund(client_id)
+            raise AdmissionRejected(
+                f"Server is busy handling {pool_name} requests. Please try again shortly.",
+                status_code=503,
+                retry_after=self.saturated_retry_after,
+            )
+
+        return _Admission(pool)
+
+
+class _Admission:
+    """Context manager holding an acquired pool slot."""
+
+    def __init__(self, pool: ConcurrencyPool):
+        self._pool = pool
+
+    def __enter__(self) -> '_Admission':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._pool.release()